@@ -1,27 +1,76 @@
 import sys
 import threading
 import time
+from queue import SimpleQueue, Empty
 from datetime import datetime
 
-import pyvisa
 import numpy as np
-import pandas as pd
 
-from PyQt5.QtCore import pyqtSignal, QObject
+from PyQt5.QtCore import pyqtSignal, QObject, QTimer
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QHBoxLayout,
     QFileDialog, QLabel, QLineEdit, QMessageBox, QGroupBox,
     QGridLayout, QStatusBar, QSpinBox, QDoubleSpinBox, QCheckBox
 )
 from PyQt5.QtGui import QFont, QPalette, QColor
+import matplotlib as mpl
+# Cheaper rendering of long line plots: merge near-collinear segments and
+# render paths in chunks
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+mpl.rcParams["agg.path.chunksize"] = 10000
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# ---------------- Data buffer ----------------
+class RingBuffer:
+    """
+    Fixed-capacity float buffer backed by a single NumPy array.
+    Every value is written twice (at idx and idx + capacity) so the
+    most recent samples are always available as one contiguous view.
+    """
+    def __init__(self, capacity, dtype=np.float64):
+        self.capacity = int(capacity)
+        self._buf = np.empty(2 * self.capacity, dtype=dtype)
+        self._head = 0   # total number of values written
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __array__(self, dtype=None, copy=None):
+        start = (self._head - self._len) % self.capacity
+        view = self._buf[start:start + self._len]
+        return view if dtype is None else view.astype(dtype, copy=False)
+
+    def append(self, value):
+        idx = self._head % self.capacity
+        self._buf[idx] = value
+        self._buf[idx + self.capacity] = value
+        self._head += 1
+        self._len = min(self._len + 1, self.capacity)
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._buf.dtype)[-self.capacity:]
+        k = len(values)
+        if k == 0:
+            return
+        idx = (self._head + np.arange(k)) % self.capacity
+        self._buf[idx] = values
+        self._buf[idx + self.capacity] = values
+        self._head += k
+        self._len = min(self._len + k, self.capacity)
+
+    def clear(self):
+        self._head = 0
+        self._len = 0
+
 # ---------------- Worker signals ----------------
 class WorkerSignals(QObject):
-    new_point = pyqtSignal(float, float, float)
     status = pyqtSignal(str)
     done = pyqtSignal()
+    connected = pyqtSignal()
+    connect_failed = pyqtSignal(str)
 
 # ---------------- Main app ----------------
 class KeithleyDeltaApp(QWidget):
@@ -33,36 +82,59 @@ class KeithleyDeltaApp(QWidget):
         # ----- Configuration defaults -----
         self.GPIB_ADDRESS = "GPIB0::15::INSTR"  # Change if needed
         self.REFRESH_INTERVAL = 0.1             
+        self.PLOT_INTERVAL_MS = 50              # ~20 FPS plot refresh
+        self.LIMIT_GROWTH = 1.2                 # headroom added when data leaves the axes
+        self.MARKER_LIMIT = 500                 # hide point markers on longer traces
         self.NPLC = 1.0
         
         # ----- Instrument handles -----
         self.rm = None
         self.k6221 = None
+        self.connected = False
 
         # ----- State -----
-        self.running = False
+        # Shared with the worker without a lock:
+        # - _running_evt is set only by the GUI (start_clicked, closeEvent)
+        #   and cleared only by the worker once a run has finished, so a
+        #   start can never be cancelled by a stale clear.
+        # - exiting is a plain bool written once by closeEvent.
+        # - start_time is written and read only by the worker.
+        self._running_evt = threading.Event()
         self.exiting = False 
-        self.lock = threading.Lock()
         self.start_time = None
-        self.times = []
-        self.voltages = []
-        self.currents = []
+
+        # Worker -> GUI data handoff, drained by the plot timer
+        self._sample_q = SimpleQueue()
 
         # ----- signals -----
         self.signals = WorkerSignals()
-        self.signals.new_point.connect(self.handle_new_point)
         self.signals.status.connect(self.set_status)
         self.signals.done.connect(self.run_done)
+        self.signals.connected.connect(self.on_connected)
+        self.signals.connect_failed.connect(self.on_connect_failed)
 
         # ----- UI -----
         self.init_ui()
 
-        # ----- Connect instruments -----
-        try:
-            self.connect_instruments()
-            self.set_status("Connected to 6221 (bridge to 2182A). Ready for Delta Mode.")
-        except Exception as e:
-            QMessageBox.critical(self, "Connection error", f"Failed to open 6221 resource: {e}")
+        # ----- Data buffers (sized for the largest possible sweep) -----
+        capacity = self.delta_count.maximum()
+        self.times = RingBuffer(capacity)
+        self.voltages = RingBuffer(capacity)
+        self.currents = RingBuffer(capacity)
+
+        # ----- Plot refresh timer (decoupled from the sample rate) -----
+        self._dirty = False
+        self._plotted_len = 0
+        self._reset_limits()
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setInterval(self.PLOT_INTERVAL_MS)
+        self._plot_timer.timeout.connect(self._flush_plot)
+        self._plot_timer.start()
+
+        # ----- Connect instruments (off the GUI thread) -----
+        self.btn_start.setEnabled(False)
+        self.set_status("Connecting to 6221...")
+        QTimer.singleShot(0, self._async_connect)
 
         # ----- Worker thread -----
         self.worker = threading.Thread(target=self.worker_loop, daemon=True)
@@ -81,7 +153,7 @@ class KeithleyDeltaApp(QWidget):
         self.ax.set_ylabel("Voltage (V)", color="tab:blue")
         self.ax.tick_params(axis='y', labelcolor="tab:blue")
         
-        self.line_v, = self.ax.plot([], [], "o-", color="tab:blue", label="Voltage (V)")
+        self.line_v, = self.ax.plot([], [], "o-", color="tab:blue", label="Voltage (V)", animated=True)
         
         # Create Twin Axis for Current
         self.ax2 = self.ax.twinx()
@@ -90,11 +162,16 @@ class KeithleyDeltaApp(QWidget):
         self.ax2.yaxis.tick_right()                
         self.ax2.tick_params(axis='y', labelcolor="tab:red")
         
-        self.line_i, = self.ax2.plot([], [], "s-", color="tab:red", label="Current (A)", alpha=0.4)
+        self.line_i, = self.ax2.plot([], [], "s-", color="tab:red", label="Current (A)", alpha=0.4, animated=True)
         
         self.fig.tight_layout()
         main_layout.addWidget(self.canvas, 3)
 
+        # Blitting: lines are animated, so every full draw leaves a clean
+        # background that we cache and paint the lines on top of.
+        self._bg = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
         # --- Control Panel ---
         panel = QGroupBox("Delta Configuration")
         panel.setMinimumWidth(320)
@@ -112,12 +189,10 @@ class KeithleyDeltaApp(QWidget):
         # 1. Common Settings
         pl.addWidget(QLabel("<b>Settings</b>"), 0, 0, 1, 2)
         
-        pl.addWidget(QLabel("NPLC (2182A):"), 1, 0)
-        self.nplc_spin = QDoubleSpinBox()
+        self.nplc_spin = self._row(pl, 1, "NPLC (2182A):", QDoubleSpinBox())
         self.nplc_spin.setDecimals(2)
         self.nplc_spin.setSingleStep(0.1)
         self.nplc_spin.setValue(self.NPLC)
-        pl.addWidget(self.nplc_spin, 1, 1)
 
         # --- Checkbox to toggle Current Plot ---
         self.chk_show_current = QCheckBox("Show Current Trace")
@@ -128,25 +203,24 @@ class KeithleyDeltaApp(QWidget):
         # 2. Delta Parameters
         pl.addWidget(QLabel("<b>Delta Parameters</b>"), 3, 0, 1, 2)
         
-        pl.addWidget(QLabel("Delta Current (A):"), 4, 0)
-        self.delta_I = QDoubleSpinBox()
+        self.delta_I = self._row(pl, 4, "Delta Current (A):", QDoubleSpinBox())
         self.delta_I.setDecimals(9)
         self.delta_I.setSingleStep(1e-6)
         self.delta_I.setValue(100e-6) 
-        pl.addWidget(self.delta_I, 4, 1)
 
-        pl.addWidget(QLabel("Count (pairs):"), 5, 0)
-        self.delta_count = QSpinBox()
+        self.delta_count = self._row(pl, 5, "Count (pairs):", QSpinBox())
         self.delta_count.setMinimum(1)
         self.delta_count.setMaximum(65000)
         self.delta_count.setValue(20)
-        pl.addWidget(self.delta_count, 5, 1)
 
-        pl.addWidget(QLabel("Delay (s):"), 6, 0)
-        self.delta_delay = QDoubleSpinBox()
+        self.delta_delay = self._row(pl, 6, "Delay (s):", QDoubleSpinBox())
         self.delta_delay.setDecimals(3)
         self.delta_delay.setValue(0.1)
-        pl.addWidget(self.delta_delay, 6, 1)
+
+        self.disp_skip = self._row(pl, 7, "Plot every N points:", QSpinBox())
+        self.disp_skip.setMinimum(1)
+        self.disp_skip.setMaximum(1000)
+        self.disp_skip.setValue(1)
 
         # 3. Action Buttons
         self.btn_start = QPushButton("▶ Start Delta")
@@ -163,17 +237,15 @@ class KeithleyDeltaApp(QWidget):
         self.btn_quit.setFont(font_btn)
         self.btn_quit.setStyleSheet("background-color: #f7d4d4")
 
-        pl.addWidget(self.btn_start, 7, 0, 1, 2)
-        pl.addWidget(self.btn_clear, 8, 0)
-        pl.addWidget(self.btn_save, 8, 1)
-        pl.addWidget(self.btn_quit, 9, 0, 1, 2)
+        pl.addWidget(self.btn_start, 8, 0, 1, 2)
+        pl.addWidget(self.btn_clear, 9, 0)
+        pl.addWidget(self.btn_save, 9, 1)
+        pl.addWidget(self.btn_quit, 10, 0, 1, 2)
 
         # 4. File settings
-        pl.addWidget(QLabel("Default Filename:"), 10, 0)
-        self.filename = QLineEdit("delta_data.csv")
-        pl.addWidget(self.filename, 10, 1)
+        self.filename = self._row(pl, 11, "Default Filename:", QLineEdit("delta_data.csv"))
 
-        pl.setRowStretch(11, 1) # Spacer
+        pl.setRowStretch(12, 1) # Spacer
 
         # Signals
         self.btn_start.clicked.connect(self.start_clicked)
@@ -188,6 +260,12 @@ class KeithleyDeltaApp(QWidget):
         outer.addWidget(self.status)
         self.setLayout(outer)
 
+    def _row(self, layout, row, label, widget):
+        """Add a 'label | widget' row to a grid layout and return the widget."""
+        layout.addWidget(QLabel(label), row, 0)
+        layout.addWidget(widget, row, 1)
+        return widget
+
     # ---------------- Toggle View Logic ----------------
     def toggle_current_view(self, checked):
         """Hides or shows the secondary Y-axis and the current line."""
@@ -200,11 +278,18 @@ class KeithleyDeltaApp(QWidget):
         else:
             self.ax2.set_ylabel("Current (A)", color="tab:red")
             self.ax2.yaxis.set_label_position("right")
+
+        # Current limits are not tracked while hidden, so refit on show
+        self._ylim2_cache = None
+        if checked and len(self.times) > 0:
+            self._update_limits(np.asarray(self.times)[-1], True)
             
         self.canvas.draw()
 
     # ---------------- Instrument connection ----------------
     def connect_instruments(self):
+        # Imported here so loading the VISA stack happens off the startup path
+        import pyvisa
         self.rm = pyvisa.ResourceManager()
         self.k6221 = self.rm.open_resource(self.GPIB_ADDRESS)
         self.k6221.timeout = 10000 # 10s timeout
@@ -219,6 +304,25 @@ class KeithleyDeltaApp(QWidget):
         self._relay_send('*RST')
         time.sleep(0.5)
 
+    def _async_connect(self):
+        threading.Thread(target=self._connect_worker, daemon=True).start()
+
+    def _connect_worker(self):
+        try:
+            self.connect_instruments()
+            self.signals.connected.emit()
+        except Exception as e:
+            self.signals.connect_failed.emit(str(e))
+
+    def on_connected(self):
+        self.connected = True
+        self.btn_start.setEnabled(True)
+        self.set_status("Connected to 6221 (bridge to 2182A). Ready for Delta Mode.")
+
+    def on_connect_failed(self, err):
+        self.set_status(f"Connection failed: {err}")
+        QMessageBox.critical(self, "Connection error", f"Failed to open 6221 resource: {err}")
+
     def _relay_send(self, cmd):
         """Helper to send command to 2182A via 6221 Serial Bridge"""
         try:
@@ -229,30 +333,33 @@ class KeithleyDeltaApp(QWidget):
 
     # ---------------- Button Handlers ----------------
     def start_clicked(self):
-        if self.running:
+        if not self.connected or self._running_evt.is_set():
             return
-        with self.lock:
-            if not self.running:
-                # Starting fresh
-                self.times = []
-                self.voltages = []
-                self.currents = []
-                # Set start_time when INIT happens to avoid plotting setup time
-                self.start_time = None 
-            
-            self.running = True
-            self.NPLC = float(self.nplc_spin.value())
-            
-            self.btn_start.setEnabled(False)
-            self.set_status("Starting Delta sequence...")
+
+        # Starting fresh
+        self.times.clear()
+        self.voltages.clear()
+        self.currents.clear()
+        self._dirty = False
+        self._plotted_len = 0
+        self._reset_limits()
+        self.line_v.set_data([], [])
+        self.line_i.set_data([], [])
+        self.canvas.draw_idle()
+        self.NPLC = float(self.nplc_spin.value())
+
+        self._running_evt.set()
+        self.btn_start.setEnabled(False)
+        self.set_status("Starting Delta sequence...")
 
     def clear_clicked(self):
-        with self.lock:
-            self.running = False
-            self.times.clear()
-            self.voltages.clear()
-            self.currents.clear()
-            self.start_time = None
+        self._drain_samples()
+        self.times.clear()
+        self.voltages.clear()
+        self.currents.clear()
+        self._dirty = False
+        self._plotted_len = 0
+        self._reset_limits()
 
         # Clear Axes
         self.ax.clear()
@@ -262,13 +369,13 @@ class KeithleyDeltaApp(QWidget):
         self.ax.set_xlabel("Time (s)")
         self.ax.set_ylabel("Voltage (V)", color="tab:blue")
         self.ax.tick_params(axis='y', labelcolor="tab:blue")
-        self.line_v, = self.ax.plot([], [], "o-", color="tab:blue", label="Voltage (V)")
+        self.line_v, = self.ax.plot([], [], "o-", color="tab:blue", label="Voltage (V)", animated=True)
         
         self.ax2.set_ylabel("Current (A)", color="tab:red")
         self.ax2.yaxis.set_label_position("right") # FIX
         self.ax2.yaxis.tick_right()                # FIX
         self.ax2.tick_params(axis='y', labelcolor="tab:red")
-        self.line_i, = self.ax2.plot([], [], "s-", color="tab:red", label="Current (A)", alpha=0.4)
+        self.line_i, = self.ax2.plot([], [], "s-", color="tab:red", label="Current (A)", alpha=0.4, animated=True)
         
         # Respect the checkbox state after clearing
         is_checked = self.chk_show_current.isChecked()
@@ -279,7 +386,7 @@ class KeithleyDeltaApp(QWidget):
 
         self.canvas.draw()
 
-        self.btn_start.setEnabled(True)
+        self.btn_start.setEnabled(self.connected and not self._running_evt.is_set())
         self.set_status("Data cleared.")
 
     def save_clicked(self):
@@ -293,78 +400,168 @@ class KeithleyDeltaApp(QWidget):
             return
         
         try:
-            df = pd.DataFrame({"Time (s)": self.times, "Voltage (V)": self.voltages, "Current (A)": self.currents})
-            df.to_csv(fname, index=False)
+            data = np.column_stack((np.asarray(self.times), np.asarray(self.voltages), np.asarray(self.currents)))
+            np.savetxt(fname, data, delimiter=",", header="Time (s),Voltage (V),Current (A)", comments="", fmt="%.9e")
             self.set_status(f"Saved to {fname}")
             QMessageBox.information(self, "Saved", f"Data saved successfully.")
         except Exception as e:
             QMessageBox.warning(self, "Save Error", f"Failed to save data: {e}")
 
     # ---------------- Data Handling ----------------
-    def handle_new_point(self, elapsed, voltage, current):
-        self.times.append(elapsed)
-        self.voltages.append(voltage)
-        self.currents.append(current)
-
-        t = np.array(self.times)
-        v = np.array(self.voltages)
-        c = np.array(self.currents)
-        
-        # Filter for plotting
-        v_finite = v[np.isfinite(v)]
-        c_finite = c[np.isfinite(c)]
+    def _drain_samples(self):
+        """Pop every batch the worker has queued. Returns a list of (t, v, i) tuples."""
+        batches = []
+        while True:
+            try:
+                batches.append(self._sample_q.get_nowait())
+            except Empty:
+                return batches
+
+    def handle_new_points(self):
+        batches = self._drain_samples()
+        if not batches:
+            return
+        t, v, c = (np.concatenate(cols) for cols in zip(*batches))
+        self.times.extend(t)
+        self.voltages.extend(v)
+        self.currents.extend(c)
+        self._dirty = True
+
+        # Running extrema, updated from the new batch only (fmin/fmax skip NaN)
+        self._v_min = np.fmin(self._v_min, np.fmin.reduce(v))
+        self._v_max = np.fmax(self._v_max, np.fmax.reduce(v))
+        self._c_min = np.fmin(self._c_min, np.fmin.reduce(c))
+        self._c_max = np.fmax(self._c_max, np.fmax.reduce(c))
+
+    def _flush_plot(self, force=False):
+        """Redraw the plot from the buffers. Driven by the plot timer."""
+        self.handle_new_points()
+        if not self._dirty:
+            return
+        if not force and len(self.times) - self._plotted_len < self.disp_skip.value():
+            return
+        self._dirty = False
+        self._plotted_len = len(self.times)
+
+        t = np.asarray(self.times)
+        v = np.asarray(self.voltages)
+        c = np.asarray(self.currents)
         
         show_current = self.chk_show_current.isChecked()
 
-        self.line_v.set_data(t, v)
-        self.line_i.set_data(t, c)
-        
+        # Plot at most ~2 points per horizontal pixel; buffers keep everything for saving
+        self.line_v.set_data(*self._decimate(t, v))
+        self.line_i.set_data(*self._decimate(t, c))
+        show_markers = len(t) <= self.MARKER_LIMIT
+        self.line_v.set_marker("o" if show_markers else "None")
+        self.line_i.set_marker("s" if show_markers else "None")
+
+        limits_changed = len(t) > 0 and self._update_limits(t[-1], show_current)
+        if self._bg is None or limits_changed:
+            # Axes changed: full redraw, background is re-cached in _on_draw
+            self.canvas.draw_idle()
+        else:
+            self._blit_lines()
         if len(t) > 0:
-            t_max = t[-1]
-            # Force X-axis to start at 0
-            self.ax.set_xlim(0, max(0.1, t_max * 1.05))
-            
-            # Scale Voltage Axis (Left)
-            if len(v_finite) > 0:
-                v_min, v_max = v_finite.min(), v_finite.max()
-                vpad = max(1e-9, 0.1 * (v_max - v_min)) if (v_max - v_min) > 0 else 1e-9
-                self.ax.set_ylim(v_min - vpad, v_max + vpad)
-            else:
-                self.ax.set_ylim(-1, 1)
-            
-            # Scale Current Axis (Right) ONLY if visible
-            if show_current:
-                if len(c_finite) > 0:
-                    c_min, c_max = c_finite.min(), c_finite.max()
-                    cpad = max(1e-12, 0.1 * (c_max - c_min)) if (c_max - c_min) > 0 else 1e-12
-                    self.ax2.set_ylim(c_min - cpad, c_max + cpad)
-                else:
-                    self.ax2.set_ylim(-1e-6, 1e-6)
+            self.set_status(f"V={v[-1]:.4e} V  I={c[-1]:.4e} A")
 
-        self.canvas.draw()
-        self.set_status(f"V={voltage:.4e} V  I={current:.4e} A")
+    def _decimate(self, t, y):
+        """
+        Thin (t, y) to about two points per pixel of axes width by keeping
+        the min and max of each bucket, so alternating or spiky signals keep
+        their envelope. The newest sample is always kept.
+        """
+        n = len(t)
+        max_points = max(2, int(self.ax.bbox.width) * 2)
+        if n <= max_points:
+            return t, y
+        size = -(-n // (max_points // 2))    # ceil division
+        m = n // size
+        buckets = y[:m * size].reshape(m, size)
+        lo = buckets.argmin(axis=1)
+        hi = buckets.argmax(axis=1)
+        base = np.arange(m) * size
+        idx = np.column_stack((base + np.minimum(lo, hi), base + np.maximum(lo, hi))).ravel()
+        if idx[-1] != n - 1:
+            idx = np.append(idx, n - 1)
+        return t[idx], y[idx]
+
+    def _reset_limits(self):
+        self._v_min = self._v_max = np.nan
+        self._c_min = self._c_max = np.nan
+        self._xlim_cache = None
+        self._ylim_cache = None
+        self._ylim2_cache = None
+
+    def _update_limits(self, t_max, show_current):
+        """
+        Grow the axis limits only when the data leaves them.
+        Returns True if any limit changed (a full redraw is needed).
+        """
+        changed = False
+
+        # Force X-axis to start at 0
+        if self._xlim_cache is None or t_max > self._xlim_cache[1]:
+            self._xlim_cache = (0, max(0.1, t_max * self.LIMIT_GROWTH))
+            self.ax.set_xlim(*self._xlim_cache)
+            changed = True
+
+        # Voltage Axis (Left)
+        ylim = self._fit_limits(self._ylim_cache, self._v_min, self._v_max, 1e-9, (-1, 1))
+        if ylim != self._ylim_cache:
+            self._ylim_cache = ylim
+            self.ax.set_ylim(*ylim)
+            changed = True
+
+        # Current Axis (Right) ONLY if visible
+        if show_current:
+            ylim2 = self._fit_limits(self._ylim2_cache, self._c_min, self._c_max, 1e-12, (-1e-6, 1e-6))
+            if ylim2 != self._ylim2_cache:
+                self._ylim2_cache = ylim2
+                self.ax2.set_ylim(*ylim2)
+                changed = True
+
+        return changed
+
+    def _fit_limits(self, cached, lo, hi, min_pad, default):
+        """Keep the cached limits while [lo, hi] fits inside them, else refit with headroom."""
+        if not (np.isfinite(lo) and np.isfinite(hi)):
+            return default
+        if cached is not None and cached != default and cached[0] <= lo and hi <= cached[1]:
+            return cached
+        pad = max(min_pad, (self.LIMIT_GROWTH - 1) * (hi - lo))
+        return (lo - pad, hi + pad)
+
+    def _on_draw(self, event):
+        """Cache the static background after a full draw and paint the lines on it."""
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line_v)
+        self.ax2.draw_artist(self.line_i)
+
+    def _blit_lines(self):
+        """Redraw only the data lines over the cached background."""
+        self.canvas.restore_region(self._bg)
+        self.ax.draw_artist(self.line_v)
+        self.ax2.draw_artist(self.line_i)
+        self.canvas.blit(self.ax.bbox)
 
     def run_done(self):
+        self._flush_plot(force=True)
         self.set_status("Delta Sequence Complete.")
-        with self.lock:
-            self.running = False
-            self.btn_start.setEnabled(True)
+        self.btn_start.setEnabled(self.connected)
 
     # ---------------- Worker Logic ----------------
     def worker_loop(self):
         """Main background loop. Only runs Delta Mode logic."""
         while not self.exiting:
-            time.sleep(0.05)
-            
-            # Check if we should run
-            with self.lock:
-                should_run = self.running
-            
-            if not should_run:
-                continue
+            # Block until start_clicked (or closeEvent) sets the event
+            self._running_evt.wait()
+            if self.exiting:
+                break
 
             # If running, execute the Delta logic
             self._run_delta_mode()
+            self._running_evt.clear()
             
             # Once finished (buffer full or error), signal done
             self.signals.done.emit()
@@ -416,6 +613,9 @@ class KeithleyDeltaApp(QWidget):
             self.k6221.write("SOUR:DELT:CAB ON")
             self.k6221.write(f"TRAC:POIN {expected}")
             self.k6221.write("FORM:ELEM READ")
+            # Binary single-precision, little-endian: 4 bytes per reading
+            self.k6221.write("FORM:DATA SRE")
+            self.k6221.write("FORM:BORD SWAP")
             
             # Arm
             self.k6221.write("SOUR:DELT:ARM")
@@ -430,40 +630,43 @@ class KeithleyDeltaApp(QWidget):
         try:
             self.k6221.write("INIT:IMM")
             
-            # Lock the start time, right after we tell it to start. 
-            with self.lock:
-                self.start_time = time.time()
+            # Set start_time right after INIT so setup time is not plotted
+            self.start_time = time.monotonic()
 
             last_len = 0
+            last_t = 0.0
             
             # Poll Loop
             while True:
-                # Read buffer
+                # Read only the readings stored since the last poll
                 try:
-                    raw = self.k6221.query("TRAC:DATA?").strip()
-                    if raw:
-                        vals = [float(x) for x in raw.split(",") if x.strip()]
+                    n_stored = int(self.k6221.query("TRAC:POIN:ACT?"))
+                    if n_stored > last_len:
+                        # Buffer index is 0-based: fetch readings last_len .. n_stored-1
+                        v_arr = self.k6221.query_binary_values(
+                            f"TRAC:DATA:SEL? {last_len},{n_stored - last_len}",
+                            datatype="f", is_big_endian=False, container=np.array
+                        ).astype(np.float64)
                     else:
-                        vals = []
+                        v_arr = np.empty(0)
                 except Exception:
-                    vals = []
+                    v_arr = np.empty(0)
 
                 # Stream new points
-                if len(vals) > last_len:
-                    now = time.time()
-                    with self.lock:
-                        base = self.start_time
-                    if base is None: base = now 
-
-                    for i in range(last_len, len(vals)):
-                        elapsed = max(0.0, (now - base)) 
-                        # Even index = High, Odd index = Low (approx)
-                        cur = I if (i % 2 == 0) else -I
-                        self.signals.new_point.emit(elapsed, vals[i], cur)
-                    last_len = len(vals)
+                if len(v_arr) > 0:
+                    elapsed = time.monotonic() - self.start_time
+                    # Spread the batch evenly between the previous poll and now
+                    k = len(v_arr)
+                    t_arr = last_t + (elapsed - last_t) * np.arange(1, k + 1) / k
+                    last_t = elapsed
+                    # Even index = High (+I), Odd index = Low (-I)
+                    idx = np.arange(last_len, last_len + len(v_arr))
+                    cur_arr = I * (1.0 - 2.0 * (idx & 1))
+                    self._sample_q.put_nowait((t_arr, v_arr, cur_arr))
+                    last_len += len(v_arr)
 
                 # Completion check
-                if len(vals) >= expected:
+                if last_len >= expected:
                     self.signals.status.emit("Buffer full. Finishing...")
                     try:
                         self.k6221.write("*RST")
@@ -480,10 +683,9 @@ class KeithleyDeltaApp(QWidget):
         self.status.showMessage(text)
 
     def closeEvent(self, event):
-        # Clean Shutdown
-        with self.lock:
-            self.running = False
+        # Clean Shutdown: flag exit, then wake the worker so it can see it
         self.exiting = True
+        self._running_evt.set()
         
         # Wait for worker
         if self.worker.is_alive():
@@ -2,60 +2,174 @@ import sys
 import threading
 import time
 import os
-import pyvisa
-import pandas as pd
+from string import Template
+from queue import SimpleQueue, Empty
+import numpy as np
 from datetime import datetime
 
-from PyQt5.QtCore import pyqtSignal, QObject
+from PyQt5.QtCore import pyqtSignal, QObject, QTimer
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QHBoxLayout,
     QFileDialog, QLabel, QLineEdit, QMessageBox, QGroupBox,
     QGridLayout, QStatusBar
 )
 from PyQt5.QtGui import QFont, QPalette, QColor
+import matplotlib as mpl
+# Cheaper rendering of long line plots: merge near-collinear segments and
+# render paths in chunks
+mpl.rcParams["path.simplify"] = True
+mpl.rcParams["path.simplify_threshold"] = 1.0
+mpl.rcParams["agg.path.chunksize"] = 10000
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 
+class SampleBuffer:
+    """
+    Growable float buffer backed by a preallocated NumPy array.
+    Capacity doubles when full, so extends are amortised O(1) and the
+    data is always exposed as one contiguous view.
+    """
+    def __init__(self, capacity=4096, dtype=np.float64):
+        self._buf = np.empty(capacity, dtype=dtype)
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __array__(self, dtype=None, copy=None):
+        view = self._buf[:self._len]
+        return view if dtype is None else view.astype(dtype, copy=False)
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self._buf.dtype)
+        end = self._len + len(values)
+        if end > len(self._buf):
+            grown = np.empty(max(end, 2 * len(self._buf)), dtype=self._buf.dtype)
+            grown[:self._len] = self._buf[:self._len]
+            self._buf = grown
+        self._buf[self._len:end] = values
+        self._len = end
+
+    def clear(self):
+        self._len = 0
+
+
 class WorkerSignals(QObject):
-    new_data = pyqtSignal(float, float)
     status = pyqtSignal(str)
+    connected = pyqtSignal(str)
+    connect_failed = pyqtSignal(str)
 
 
 class KeithleyApp(QWidget):
+    BUFFER_SIZE = 1000      # readings per instrument buffer fill (6485 max is 2500)
+    POLL_INTERVAL = 0.1     # s between buffer polls
+    MARKER_LIMIT = 500      # hide point markers on longer traces
+    LIMIT_GROWTH = 1.2      # headroom added when data leaves the axes
+
+    BUTTON_STYLE = Template("""
+        QPushButton {
+            background-color: $bg;
+            border: none;
+            border-radius: 12px;
+            color: $fg;
+            padding: 10px;
+        }
+        QPushButton:hover {
+            background-color: #555555;
+        }
+        QPushButton:pressed {
+            background-color: #222222;
+        }
+        QPushButton:disabled {
+            background-color: #BDBDBD;
+            color: #757575;
+        }
+    """)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Keithley 6485 Picoammeter Control Panel")
         self.resize(1400, 700)
 
-        # VISA setup
-        self.rm = pyvisa.ResourceManager()
-        self.inst = self.rm.open_resource("GPIB0::14::INSTR")
-        print("Connected to:", self.inst.query("*IDN?").strip())
-        self.inst.timeout = 10000
-        self.setup_instrument()
+        # VISA handles, opened in the background by _async_connect
+        self.rm = None
+        self.inst = None
+        self.connected = False
 
         # Data
-        self.readings = []
-        self.timestamps = []
+        self.readings = SampleBuffer()
+        self.timestamps = SampleBuffer()
         self.running = False
         self.paused = False
         
         self.total_run_time = 0.0
         self.last_resume_time = None
-        self.lock = threading.Lock()
+
+        # Worker handoff: the event is set while acquiring, _time_base is a
+        # (generation, total_run_time, last_resume_time, setup_generation)
+        # tuple swapped in one atomic assignment, and samples come back
+        # through a lock-free queue. Every play/pause/clear bumps the
+        # generation so the worker re-arms even if it missed the event being
+        # cleared and set again; every fresh start bumps the setup generation
+        # so the worker reconfigures the instrument. Once connected, all
+        # instrument I/O happens on the worker.
+        self._acquiring = threading.Event()
+        self._run_gen = 0
+        self._setup_gen = 0
+        self._time_base = (0, 0.0, None, 0)
+        self._sample_q = SimpleQueue()
 
         # Worker signals
         self.signals = WorkerSignals()
-        self.signals.new_data.connect(self.handle_new_data)
         self.signals.status.connect(self.update_status)
+        self.signals.connected.connect(self.on_connected)
+        self.signals.connect_failed.connect(self.on_connect_failed)
 
         self.init_ui()
 
+        # Connect after the window is up so the UI paints immediately
+        self.btn_play.setEnabled(False)
+        self.update_status("Connecting...")
+        QTimer.singleShot(0, self._async_connect)
+
+        # Plot refresh timer (~20 FPS, decoupled from the sample rate)
+        self._dirty = False
+        self._reset_limits()
+        self._plot_timer = QTimer(self)
+        self._plot_timer.setInterval(50)
+        self._plot_timer.timeout.connect(self._flush_plot)
+        self._plot_timer.start()
+
         # Thread for data acquisition
         self.thread = threading.Thread(target=self.update_loop, daemon=True)
         self.thread.start()
 
+    def _async_connect(self):
+        threading.Thread(target=self._connect_worker, daemon=True).start()
+
+    def _connect_worker(self):
+        try:
+            # Imported here so loading the VISA stack happens off the startup path
+            import pyvisa
+            self.rm = pyvisa.ResourceManager()
+            self.inst = self.rm.open_resource("GPIB0::14::INSTR")
+            idn = self.inst.query("*IDN?").strip()
+            self.inst.timeout = 10000
+            self.setup_instrument()
+            self.signals.connected.emit(idn)
+        except Exception as e:
+            self.signals.connect_failed.emit(str(e))
+
+    def on_connected(self, idn):
+        self.connected = True
+        self.btn_play.setEnabled(True)
+        self.update_status(f"Connected: {idn}. Ready.")
+
+    def on_connect_failed(self, err):
+        self.update_status(f"Connection failed: {err}")
+        QMessageBox.critical(self, "Connection error", f"Failed to open 6485 resource: {err}")
+
     def setup_instrument(self):
         self.inst.write("*RST")
         self.inst.write("*CLS")
@@ -68,7 +182,20 @@ class KeithleyApp(QWidget):
         self.inst.write("SENS:AVER:COUN 5")
         self.inst.write("SENS:AVER:TCON REP")
         self.inst.write("TRIG:SOUR IMM")
-        self.inst.write("TRIG:COUN 1")
+        # Acquire into the instrument buffer and stream it back in chunks
+        self.inst.write(f"TRIG:COUN {self.BUFFER_SIZE}")
+        self.inst.write(f"TRAC:POIN {self.BUFFER_SIZE}")
+        self.inst.write("TRAC:FEED SENS")
+        # Bare readings only, binary single-precision little-endian
+        self.inst.write("FORM:ELEM READ")
+        self.inst.write("FORM:DATA SRE")
+        self.inst.write("FORM:BORD SWAP")
+
+    def arm_buffer(self):
+        """Clear the reading buffer and start a new buffered acquisition."""
+        self.inst.write("TRAC:CLE")
+        self.inst.write("TRAC:FEED:CONT NEXT")
+        self.inst.write("INIT")
 
     def init_ui(self):
         main_layout = QHBoxLayout(self)
@@ -80,8 +207,14 @@ class KeithleyApp(QWidget):
         self.ax.set_title("Current vs Time")
         self.ax.set_xlabel("Time (s)")
         self.ax.set_ylabel("Current (A)")
+        self.line, = self.ax.plot([], [], marker='o', linestyle='-', animated=True)
         main_layout.addWidget(self.canvas, 3)
 
+        # Blitting: the line is animated, so every full draw leaves a clean
+        # background that we cache and paint the line on top of.
+        self._bg = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
         # Controls group box
         controls_box = QGroupBox("Controls")
         controls_box.setMinimumWidth(300)
@@ -99,6 +232,7 @@ class KeithleyApp(QWidget):
         main_layout.addWidget(controls_box, 1)
 
         font_button = QFont("Segoe UI", 14, QFont.Bold)
+        font_label = QFont("Segoe UI", 12)
 
         self.btn_play = QPushButton("▶ Play")
         self.style_button(self.btn_play, font_button, bg_color="#89A88A")
@@ -117,9 +251,9 @@ class KeithleyApp(QWidget):
         self.style_button(self.btn_quit, font_button, bg_color="#FFFFFF", fg_color="#000000")
 
         filename_label = QLabel("Filename:")
-        filename_label.setFont(QFont("Segoe UI", 12))
+        filename_label.setFont(font_label)
         self.filename_input = QLineEdit("readings.csv")
-        self.filename_input.setFont(QFont("Segoe UI", 12))
+        self.filename_input.setFont(font_label)
         self.filename_input.setMinimumHeight(35)
 
         self.btn_browse = QPushButton("Browse...")
@@ -152,25 +286,7 @@ class KeithleyApp(QWidget):
     def style_button(self, button, font, bg_color="#E0E0E0", fg_color="#FFFFFF"):
         button.setFont(font)
         button.setMinimumHeight(50)
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg_color};
-                border: none;
-                border-radius: 12px;
-                color: {fg_color};
-                padding: 10px;
-            }}
-            QPushButton:hover {{
-                background-color: #555555;
-            }}
-            QPushButton:pressed {{
-                background-color: #222222;
-            }}
-            QPushButton:disabled {{
-                background-color: #BDBDBD;
-                color: #757575;
-            }}
-        """)
+        button.setStyleSheet(self.BUTTON_STYLE.substitute(bg=bg_color, fg=fg_color))
 
     def update_status(self, message):
         self.status_bar.showMessage(message)
@@ -190,17 +306,23 @@ class KeithleyApp(QWidget):
 
 
     def play_reading(self):
-        with self.lock:
-            if self.running and not self.paused:
-                self.update_status("Already running.")
-                return
+        if not self.connected:
+            self.update_status("Not connected.")
+            return
+
+        if self.running and not self.paused:
+            self.update_status("Already running.")
+            return
 
-            if not self.running and not self.paused:
-                self.setup_instrument()
+        # A fresh start (not a resume) reconfigures the instrument on the worker
+        if not self.running and not self.paused:
+            self._setup_gen += 1
 
-            self.running = True
-            self.paused = False
-            self.last_resume_time = time.time()
+        self.running = True
+        self.paused = False
+        self.last_resume_time = time.monotonic()
+        self._publish_time_base()
+        self._acquiring.set()
 
         self.btn_play.setEnabled(False)
         self.btn_pause.setEnabled(True)
@@ -208,19 +330,24 @@ class KeithleyApp(QWidget):
 
 
     def pause_reading(self):
-        with self.lock:
-            if not self.running or self.paused:
-                self.update_status("Not running or already paused.")
-                return
-
-            self.paused = True
-            run_duration = time.time() - self.last_resume_time
-            self.total_run_time += run_duration
+        if not self.running or self.paused:
+            self.update_status("Not running or already paused.")
+            return
+
+        self._acquiring.clear()
+        self.paused = True
+        run_duration = time.monotonic() - self.last_resume_time
+        self.total_run_time += run_duration
+        self._publish_time_base()
         
         self.btn_pause.setEnabled(False)
         self.btn_play.setEnabled(True)
         self.signals.status.emit("Measurement paused.")
 
+    def _publish_time_base(self):
+        self._run_gen += 1
+        self._time_base = (self._run_gen, self.total_run_time, self.last_resume_time, self._setup_gen)
+
     def clear_data(self):
         reply = QMessageBox.question(
             self,
@@ -230,21 +357,23 @@ class KeithleyApp(QWidget):
             QMessageBox.No
         )
         if reply == QMessageBox.Yes:
-            self.readings.clear()
-            self.timestamps.clear()
-            self.ax.clear()
-            self.ax.set_title("Current vs Time")
-            self.ax.set_xlabel("Time (s)")
-            self.ax.set_ylabel("Current (A)")
-            self.canvas.draw()
-
+            self._acquiring.clear()
             self.running = False
             self.paused = False
-            
             self.total_run_time = 0.0
             self.last_resume_time = None
+            # Retire the old generation before draining, so a batch the worker
+            # is still finishing is discarded rather than landing after the clear
+            self._publish_time_base()
+            self._drain_samples()
+            self.readings.clear()
+            self.timestamps.clear()
+            self._dirty = False
+            self._reset_limits()
+            self.line.set_data([], [])
+            self.canvas.draw_idle()
 
-            self.btn_play.setEnabled(True)
+            self.btn_play.setEnabled(self.connected)
             self.btn_pause.setEnabled(False)
 
             self.update_status("Data cleared.")
@@ -261,62 +390,181 @@ class KeithleyApp(QWidget):
             timestamp = datetime.now().strftime("%Y-%m-%d_at_%H:%M:%S")
             filename = f"{base}_{timestamp}{ext}"
 
-        df = pd.DataFrame({
-            "Time": self.timestamps,
-            "current_A": self.readings
-        })
-        df.to_csv(filename, index=False)
+        data = np.column_stack((np.asarray(self.timestamps), np.asarray(self.readings)))
+        np.savetxt(filename, data, delimiter=",", header="Time,current_A", comments="", fmt="%.9e")
         self.update_status(f"Data saved to {filename}")
         QMessageBox.information(self, "Saved", "Data saved.")
 
-    def handle_new_data(self, elapsed, reading):
-        self.timestamps.append(elapsed)
-        self.readings.append(reading)
+    def _drain_samples(self):
+        batches = []
+        while True:
+            try:
+                batches.append(self._sample_q.get_nowait())
+            except Empty:
+                return batches
+
+    def handle_new_data(self):
+        for elapsed, readings in self._drain_samples():
+            self.timestamps.extend(elapsed)
+            self.readings.extend(readings)
+            self._dirty = True
+            # Running extrema, updated from the new batch only (fmin/fmax skip NaN)
+            self._r_min = np.fmin(self._r_min, np.fmin.reduce(readings))
+            self._r_max = np.fmax(self._r_max, np.fmax.reduce(readings))
+
+    def _flush_plot(self):
+        self.handle_new_data()
+        if not self._dirty:
+            return
+        self._dirty = False
         self.update_plot()
-        self.update_status(f"Reading: {reading:.3e} A @ {elapsed:.1f} s")
+        if len(self.readings) > 0:
+            t = np.asarray(self.timestamps)
+            r = np.asarray(self.readings)
+            self.update_status(f"Reading: {r[-1]:.3e} A @ {t[-1]:.1f} s")
 
     def update_plot(self):
-        self.ax.clear()
-        self.ax.plot(self.timestamps, self.readings, marker='o', linestyle='-')
-        self.ax.set_title("Current vs Time")
-        self.ax.set_xlabel("Time (s)")
-        self.ax.set_ylabel("Current (A)")
-        self.canvas.draw()
+        t = np.asarray(self.timestamps)
+        r = np.asarray(self.readings)
+        # Plot at most ~2 points per horizontal pixel; the buffers keep everything for saving
+        self.line.set_data(*self._decimate(t, r))
+        self.line.set_marker('o' if len(t) <= self.MARKER_LIMIT else 'None')
+
+        limits_changed = len(t) > 0 and self._update_limits(t[-1])
+        if self._bg is None or limits_changed:
+            # Axes changed: full redraw, background is re-cached in _on_draw
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._bg)
+            self.ax.draw_artist(self.line)
+            self.canvas.blit(self.ax.bbox)
+
+    def _decimate(self, t, y):
+        """
+        Thin (t, y) to about two points per pixel of axes width by keeping
+        the min and max of each bucket, so alternating or spiky signals keep
+        their envelope. The newest sample is always kept.
+        """
+        n = len(t)
+        max_points = max(2, int(self.ax.bbox.width) * 2)
+        if n <= max_points:
+            return t, y
+        size = -(-n // (max_points // 2))    # ceil division
+        m = n // size
+        buckets = y[:m * size].reshape(m, size)
+        lo = buckets.argmin(axis=1)
+        hi = buckets.argmax(axis=1)
+        base = np.arange(m) * size
+        idx = np.column_stack((base + np.minimum(lo, hi), base + np.maximum(lo, hi))).ravel()
+        if idx[-1] != n - 1:
+            idx = np.append(idx, n - 1)
+        return t[idx], y[idx]
+
+    def _reset_limits(self):
+        self._r_min = self._r_max = np.nan
+        self._xlim_cache = None
+        self._ylim_cache = None
+
+    def _update_limits(self, t_max):
+        """
+        Grow the axis limits only when the data leaves them.
+        Returns True if any limit changed (a full redraw is needed).
+        """
+        changed = False
+
+        if self._xlim_cache is None or t_max > self._xlim_cache[1]:
+            self._xlim_cache = (0, max(0.1, t_max * self.LIMIT_GROWTH))
+            self.ax.set_xlim(*self._xlim_cache)
+            changed = True
+
+        ylim = self._fit_limits(self._ylim_cache, self._r_min, self._r_max, 1e-12, (-1e-9, 1e-9))
+        if ylim != self._ylim_cache:
+            self._ylim_cache = ylim
+            self.ax.set_ylim(*ylim)
+            changed = True
+
+        return changed
+
+    def _fit_limits(self, cached, lo, hi, min_pad, default):
+        """Keep the cached limits while [lo, hi] fits inside them, else refit with headroom."""
+        if not (np.isfinite(lo) and np.isfinite(hi)):
+            return default
+        if cached is not None and cached != default and cached[0] <= lo and hi <= cached[1]:
+            return cached
+        pad = max(min_pad, (self.LIMIT_GROWTH - 1) * (hi - lo))
+        return (lo - pad, hi + pad)
+
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
 
     def update_loop(self):
+        armed = False
+        armed_gen = None
+        done_setup_gen = 0      # the connect thread already ran setup_instrument()
         while True:
-            is_running = False
-            is_paused = True
-            
-            with self.lock:
-                is_running = self.running
-                is_paused = self.paused
-                if is_running and not is_paused:
-                    total_time = self.total_run_time
-                    resume_time = self.last_resume_time
-
-            if is_running and not is_paused:
-                try:
-                    # Perform slow I/O operations OUTSIDE the lock
-                    val_str = self.inst.query("READ?").strip().split(",")[0]
-                    val = float(val_str.replace("A", "").strip())
-                    
-                    now = time.time()
-                    current_run_duration = now - resume_time
-                    elapsed = total_time + current_run_duration
-
-                    self.signals.new_data.emit(elapsed, val)
-                    time.sleep(0.1)
-                except Exception as e:
-                    self.signals.status.emit(f"Error: {e}")
-                    with self.lock:
-                        self.running = False
-                        self.paused = False
-                    self.btn_play.setEnabled(True)
-                    self.btn_pause.setEnabled(False)
-            else:
-                time.sleep(0.3)
-
+            if not self._acquiring.is_set():
+                if armed:
+                    # Paused or cleared: stop the running acquisition
+                    try:
+                        self.inst.write("ABOR")
+                    except Exception:
+                        pass
+                    armed = False
+                # Block until play_reading sets the event
+                self._acquiring.wait()
+                continue
+
+            gen, total_time, resume_time, setup_gen = self._time_base
+            try:
+                # Perform slow I/O operations on the worker thread
+                if not armed or gen != armed_gen:
+                    # First start, or paused/resumed since we armed: drop
+                    # anything acquired under the old time base
+                    if armed:
+                        self.inst.write("ABOR")
+                    if setup_gen != done_setup_gen:
+                        self.setup_instrument()
+                        done_setup_gen = setup_gen
+                    self.arm_buffer()
+                    armed = True
+                    armed_gen = gen
+                    last_len = 0
+                    last_t = total_time + (time.monotonic() - resume_time)
+
+                n_stored = int(self.inst.query("TRAC:POIN:ACT?"))
+                if n_stored > last_len:
+                    vals = self.inst.query_binary_values(
+                        f"TRAC:DATA:SEL? {last_len},{n_stored - last_len}",
+                        datatype="f", is_big_endian=False, container=np.array
+                    ).astype(np.float64)
+
+                    elapsed = total_time + (time.monotonic() - resume_time)
+                    # Spread the batch evenly between the previous poll and now
+                    k = len(vals)
+                    t_arr = last_t + (elapsed - last_t) * np.arange(1, k + 1) / k
+                    last_t = elapsed
+
+                    if self._time_base[0] != gen:
+                        # Paused or cleared while fetching; re-arm on the next pass
+                        continue
+                    self._sample_q.put_nowait((t_arr, vals))
+                    last_len = n_stored
+
+                if last_len >= self.BUFFER_SIZE:
+                    # Buffer full: re-arm immediately for the next chunk
+                    self.arm_buffer()
+                    last_len = 0
+                else:
+                    time.sleep(self.POLL_INTERVAL)
+            except Exception as e:
+                self.signals.status.emit(f"Error: {e}")
+                self._acquiring.clear()
+                armed = False
+                self.running = False
+                self.paused = False
+                self.btn_play.setEnabled(True)
+                self.btn_pause.setEnabled(False)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)